@@ -1,30 +1,41 @@
 #!/usr/bin/python3
+import logging
 import signal
 import sys
 from argparse import ArgumentParser
 from functools import partial
 from pathlib import Path
 from types import TracebackType
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
 import argcomplete
-from PyQt6.QtCore import QRect, QPoint
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QMainWindow, QApplication, QMessageBox
 from argcomplete import FilesCompleter
 from ptyx_mcq.parameters import CONFIG_FILE_EXTENSION
 
-from ptyx_mcq_corrector.main_window import ICON_PATH, McqCorrectorMainWindow
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QApplication, QMainWindow
 
-from ptyx_mcq_corrector.signal_wake_up import SignalWakeupHandler
+
+def _noop_signal_handler(sig: int, frame) -> None:
+    """Python-side SIGINT handler.
+
+    It only needs to exist so that the signal is written to the wakeup socket;
+    the actual quit is performed in the Qt event loop (see `_quit_on_sigint`)."""
+
+
+def _quit_on_sigint(app: "QApplication", sig: int) -> None:
+    if sig == signal.SIGINT:
+        app.quit()
 
 
 def my_excepthook(
     type_: Type[BaseException],
     value: BaseException,
     traceback: TracebackType | None,
-    window: QMainWindow = None,
+    window: "QMainWindow" = None,
 ) -> None:
+    from PyQt6.QtWidgets import QMessageBox
+
     # TODO: Log the exception here?
     # noinspection PyTypeChecker
     QMessageBox.critical(window, "Something went wrong!", f"{type(value).__name__}: {value}")
@@ -45,17 +56,35 @@ def main(args: list | None = None) -> None:
     )
     argcomplete.autocomplete(parser, always_complete_options=False)
     parsed_args = parser.parse_args(args)
+
+    # Defer the Qt imports (and everything the main window pulls in) until after
+    # argument parsing, so that `--help` and shell completion don't pay for them.
+    from PyQt6.QtCore import QRect, QPoint
+    from PyQt6.QtGui import QImageReader, QPixmapCache
+    from PyQt6.QtWidgets import QApplication
+
+    import ptyx_mcq_corrector.param as param
+    from ptyx_mcq_corrector.main_window import McqCorrectorMainWindow
+    from ptyx_mcq_corrector.signal_wake_up import SignalWakeupHandler
+
+    logging.basicConfig(level=logging.DEBUG if param.DEBUG else logging.WARNING)
+
     try:
         app = QApplication(sys.argv)
-        app.setWindowIcon(QIcon(str(ICON_PATH)))
+        app.setWindowIcon(param.get_app_icon())
+        # Bound the application-wide pixmap cache (used for scanned pages display).
+        QPixmapCache.setCacheLimit(param.PIXMAP_CACHE_LIMIT_KB)
+        # High-resolution scans may exceed Qt's default image allocation limit,
+        # making them silently fail to load. Disable the limit.
+        QImageReader.setAllocationLimit(0)
         # Used to handle Ctrl+C
         # https://stackoverflow.com/questions/4938723/what-is-the-correct-way-to-make-my-pyqt-application-quit-when-killed-from-the-co
-        SignalWakeupHandler(app)
+        wakeup_handler = SignalWakeupHandler(app)
+        wakeup_handler.signalReceived.connect(partial(_quit_on_sigint, app))
+        signal.signal(signal.SIGINT, _noop_signal_handler)
         main_window = McqCorrectorMainWindow(parsed_args)
         # Don't close pyQt application on failure.
         sys.excepthook = partial(my_excepthook, window=main_window)
-        # Used to handle Ctrl+C
-        signal.signal(signal.SIGINT, lambda sig, _: app.quit())
         main_window.move(
             main_window.screen().geometry().center()  # type: ignore
             - QRect(QPoint(), main_window.frameGeometry().size()).center()
@@ -1,9 +1,39 @@
 from pathlib import Path
 
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
 from PyQt6.QtWidgets import QWidget, QComboBox, QLabel, QHBoxLayout, QVBoxLayout
 
 
+class _ImageLoaderSignals(QObject):
+    loaded = pyqtSignal(QImage, str)
+
+
+class _ImageLoader(QRunnable):
+    """Decode an image file into a QImage outside the GUI thread.
+
+    Unlike QPixmap, QImage decoding is reentrant and may run in any thread,
+    so the costly decode step is done on the thread pool; the receiver then
+    converts to QPixmap on the main thread when `loaded` fires."""
+
+    def __init__(self, key: str, path: str, target_size: QSize = None):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.target_size = target_size
+        self.signals = _ImageLoaderSignals()
+
+    def run(self) -> None:
+        # Decode straight into the display size: a 300 dpi A4 page is ~8 MP,
+        # storing it at full resolution would pin tens of MB per pixmap.
+        reader = QImageReader(self.path)
+        if self.target_size is not None and self.target_size.isValid():
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(self.target_size, Qt.AspectRatioMode.KeepAspectRatio))
+        self.signals.loaded.emit(reader.read(), self.key)
+
+
 class ImageDisplayWindow(QWidget):
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
@@ -14,12 +44,20 @@ class ImageDisplayWindow(QWidget):
         self.comboBox.addItem("Image 2")
 
         # Connect the combo box selection change to a method
-        self.comboBox.currentIndexChanged.connect(self.select_image)
+        self.comboBox.currentIndexChanged.connect(self.update_images)
 
         # Create labels for the images
         self.label1 = QLabel(self)
         self.label2 = QLabel(self)
 
+        # Cache keys of the currently displayed images (path plus target size:
+        # the same page may be decoded at several resolutions, see `_cache_key()`).
+        self._key1: str = ""
+        self._key2: str = ""
+        # Decoded pixmaps, kept so that combo-box switches don't re-decode anything.
+        self.pixmap1: QPixmap | None = None
+        self.pixmap2: QPixmap | None = None
+
         # Create a horizontal layout for the images
         hbox = QHBoxLayout()
         hbox.addWidget(self.label1)
@@ -36,16 +74,49 @@ class ImageDisplayWindow(QWidget):
         # Set the window title and size
         self.setWindowTitle("Select Image to Display")
 
+    @staticmethod
+    def _cache_key(path: str, size: QSize) -> str:
+        """Pixmap cache key for `path` decoded to fit `size`.
+
+        Images are decoded scaled to the target label: keying the cache by
+        path alone would pin the first decoded resolution forever (e.g. the
+        tiny pre-layout label size), and make differently sized labels share
+        one entry. Including the size forces a re-decode when it changes."""
+        return f"{path}@{size.width()}x{size.height()}"
+
     def set_images(self, path1: Path, path2: Path):
-        """Load the images."""
-        self.label1.setPixmap(QPixmap(path1))
-        self.label2.setPixmap(QPixmap(path2))
+        """Load the images.
+
+        Already-cached images are displayed at once; decoding of the other ones
+        is delegated to the global thread pool, to avoid freezing the interface."""
+        self._key1 = self._cache_key(str(path1), self.label1.size())
+        self._key2 = self._cache_key(str(path2), self.label2.size())
+        for key, path, label in ((self._key1, path1, self.label1), (self._key2, path2, self.label2)):
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None:
+                loader = _ImageLoader(key, str(path), label.size())
+                loader.signals.loaded.connect(self._on_image_loaded)
+                QThreadPool.globalInstance().start(loader)
+            else:
+                self._display_pixmap(key, pixmap)
+
+    def _on_image_loaded(self, image: QImage, key: str) -> None:
+        """Convert the decoded image to a pixmap (main thread only) and display it."""
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self._display_pixmap(key, pixmap)
+
+    def _display_pixmap(self, key: str, pixmap: QPixmap) -> None:
+        if key == self._key1:
+            self.pixmap1 = pixmap
+            self.label1.setPixmap(pixmap)
+        if key == self._key2:
+            self.pixmap2 = pixmap
+            self.label2.setPixmap(pixmap)
 
     # Method to update the images based on combo box selection
     def update_images(self, index: int) -> None:
-        if index == 0:
-            self.label1.setPixmap(self.pixmap1)
-            self.label2.setPixmap(self.pixmap1)
-        else:
-            self.label1.setPixmap(self.pixmap2)
-            self.label2.setPixmap(self.pixmap2)
+        pixmap = self.pixmap1 if index == 0 else self.pixmap2
+        if pixmap is not None:
+            self.label1.setPixmap(pixmap)
+            self.label2.setPixmap(pixmap)
@@ -7,16 +7,21 @@ if TYPE_CHECKING:
 
 
 class EnhancedWidget(QWidget):
+    _main_window_cache: "McqCorrectorMainWindow | None" = None
+
     def _get_main_window(self) -> "McqCorrectorMainWindow":
         from ptyx_mcq_corrector.main_window import McqCorrectorMainWindow
 
-        widget: QWidget = self
-        while widget.parent() is not None:
-            widget = widget.parent()  # type: ignore
+        # `QWidget.window()` walks the parent chain on the C++ side,
+        # avoiding one Python `parent()` round-trip per ancestor.
+        widget = self.window()
         assert isinstance(widget, McqCorrectorMainWindow), widget
         return widget
 
-    # TODO: use a cache ?
     @property
-    def main_window(self):
-        return self._get_main_window()
+    def main_window(self) -> "McqCorrectorMainWindow":
+        # The main window never changes during the widget lifetime,
+        # so resolve it only once instead of walking the parent chain on each access.
+        if self._main_window_cache is None:
+            self._main_window_cache = self._get_main_window()
+        return self._main_window_cache
@@ -1,14 +1,14 @@
-from functools import wraps
+import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, Callable
 
-from PyQt6.QtCore import QObject
-from PyQt6.QtWidgets import QMessageBox, QFileDialog
+from PyQt6.QtCore import QObject, QTimer, pyqtSlot
+from PyQt6.QtWidgets import QFileDialog
 from ptyx_mcq.parameters import CONFIG_FILE_EXTENSION
 
 import ptyx_mcq_corrector.param as param
 from ptyx_mcq_corrector.internal_state import Action
-from ptyx_mcq_corrector.scan.conflict_handlers import (
+from ptyx_mcq_corrector.scan.requests import (
     McqRequest,
     McqAnswersRequest,
     McqIntegrityRequest,
@@ -18,16 +18,18 @@ from ptyx_mcq_corrector.scan.conflict_handlers import (
 if TYPE_CHECKING:
     from ptyx_mcq_corrector.main_window import McqCorrectorMainWindow
 
-Abort = QMessageBox.StandardButton.Abort
-Discard = QMessageBox.StandardButton.Discard
-Save = QMessageBox.StandardButton.Save
+logger = logging.getLogger(__name__)
 
-FILES_FILTER = (
-    "All supported Files (*.ex *.ptyx)",
-    "Mcq Exercises Files (*.ex)",
-    "pTyX Files (*.ptyx)",
-    "All Files (*.*)",
+# Dialog filters, joined once at import time instead of on every dialog open.
+FILES_FILTER = ";;".join(
+    (
+        "All supported Files (*.ex *.ptyx)",
+        "Mcq Exercises Files (*.ex)",
+        "pTyX Files (*.ptyx)",
+        "All Files (*.*)",
+    )
 )
+CONFIG_FILE_FILTER = f"pTyX MCQ configuration file (*{CONFIG_FILE_EXTENSION})"
 
 
 def update_ui(f: Callable[..., bool]) -> Callable[..., bool]:
@@ -37,39 +39,131 @@ def update_ui(f: Callable[..., bool]) -> Callable[..., bool]:
 
     When nested operations are performed, intermediate ui updates are prevented by
     freezing temporally the user interface, then updating it only once the last operation is performed.
-    """
 
-    @wraps(f)
-    def wrapper(self: "FileEventsHandler", *args, **kw) -> bool:
-        current_freeze_value = self.freeze_update_ui
-        self.freeze_update_ui = True
-        if not param.DEBUG:
-            self.main_window.setUpdatesEnabled(False)
-        try:
-            if param.DEBUG:
-                _args = [repr(arg) for arg in args] + [f"{key}={val!r}" for (key, val) in kw.items()]
-                print(f"{f.__name__}({', '.join(_args)})")
-            else:
-                print(f.__name__)
-            update = f(self, *args, **kw)
-            assert isinstance(
-                update, bool
-            ), f"Method `FileEventsHandler.{f.__name__}` must return a boolean, not {update!r}"
-            if update and not current_freeze_value:
-                self._update_ui()
-            return update
-        finally:
-            self.main_window.setUpdatesEnabled(True)
-            self.freeze_update_ui = current_freeze_value
+    The freeze is implemented as a nesting-depth counter: repaints are only disabled when
+    entering the outermost decorated call, and re-enabled when leaving it, so nested calls
+    don't toggle the Qt paint state back and forth.
+
+    Successful nested calls mark the interface as dirty; the pending update is then
+    performed exactly once when the outermost call completes, even if the outermost
+    operation itself reported no change.
+    """
 
+    # `param.DEBUG` is a module-level constant: test it once at decoration time
+    # and return a specialized wrapper, instead of re-testing it on every call.
+    # Bind the function name to a local too, to avoid per-call attribute lookups.
+    f_name = f.__name__
+
+    if param.DEBUG:
+
+        def wrapper(self: "FileEventsHandler", *args, **kw) -> bool:
+            depth = self.freeze_update_ui
+            self.freeze_update_ui = depth + 1
+            try:
+                if logger.isEnabledFor(logging.DEBUG):
+                    _args = [repr(arg) for arg in args] + [f"{key}={val!r}" for (key, val) in kw.items()]
+                    logger.debug("%s(%s)", f_name, ", ".join(_args))
+                update = f(self, *args, **kw)
+                assert isinstance(
+                    update, bool
+                ), f"Method `FileEventsHandler.{f_name}` must return a boolean, not {update!r}"
+                if update:
+                    self._ui_dirty = True
+                if depth == 0 and self._ui_dirty:
+                    self._ui_dirty = False
+                    self._update_ui()
+                return update
+            finally:
+                self.freeze_update_ui = depth
+
+    else:
+
+        def wrapper(self: "FileEventsHandler", *args, **kw) -> bool:
+            depth = self.freeze_update_ui
+            self.freeze_update_ui = depth + 1
+            if depth == 0:
+                self.main_window.setUpdatesEnabled(False)
+            try:
+                update = f(self, *args, **kw)
+                if update:
+                    self._ui_dirty = True
+                if depth == 0 and self._ui_dirty:
+                    self._ui_dirty = False
+                    self._update_ui()
+                return update
+            finally:
+                self.freeze_update_ui = depth
+                if depth == 0:
+                    self.main_window.setUpdatesEnabled(True)
+
+    # A full `functools.wraps` would also copy module, doc and dict, and keep the
+    # wrapped function alive through `__wrapped__`; only the names are needed here.
+    wrapper.__name__ = f_name
+    wrapper.__qualname__ = f.__qualname__
     return wrapper
 
 
+def throttle(interval_ms: int) -> Callable[[Callable], Callable]:
+    """Decorator coalescing rapid calls of a (no-argument) method.
+
+    The first call runs immediately; calls arriving during the next `interval_ms`
+    milliseconds are merged into a single deferred run, scheduled with a Qt timer.
+    Qt timers fire on the GUI thread, so no locking is needed.
+    """
+
+    def decorator(f: Callable) -> Callable:
+        throttled_attr = f"_{f.__name__}_throttled"
+        pending_attr = f"_{f.__name__}_pending"
+
+        def wrapper(self) -> None:
+            if getattr(self, throttled_attr, False):
+                setattr(self, pending_attr, True)
+                return
+            setattr(self, throttled_attr, True)
+
+            def release() -> None:
+                setattr(self, throttled_attr, False)
+                if getattr(self, pending_attr, False):
+                    setattr(self, pending_attr, False)
+                    wrapper(self)
+
+            f(self)
+            QTimer.singleShot(interval_ms, release)
+
+        wrapper.__name__ = f.__name__
+        wrapper.__qualname__ = f.__qualname__
+        return wrapper
+
+    return decorator
+
+
 class FileEventsHandler(QObject):
     def __init__(self, main_window: "McqCorrectorMainWindow"):
         super().__init__(parent=main_window)
         self.main_window: Final = main_window
-        self.freeze_update_ui: bool = False  # See update_ui() decorator docstring.
+        self.freeze_update_ui: int = 0  # Nesting depth, see update_ui() decorator docstring.
+        self._ui_dirty: bool = False  # Update requested by a nested update_ui() call.
+        self._open_file_dialog: QFileDialog | None = None  # See open_file_dialog().
+        # Header HTML template, built once: Qt re-runs the rich-text parser on
+        # every setText() call, so the text is only set when the name changes.
+        self._header_template: Final = (
+            "<p style='text-align:center'>Document <i><b>{name}</b></i> selected.</p>"
+            "<p style='text-align:center;font-size:small'>Press <b>F5</b> to start scanning.</p>"
+        )
+        # ("" is never a valid shortname, so the first refresh always sets the header.)
+        self._last_header_name: str | None = ""
+        # Jump tables for _update_ui: a dict lookup replaces sequential
+        # pattern tests on every refresh.
+        self._action_dispatch: Final[dict[Action, Callable[[], None]]] = {
+            Action.NONE: self.action_none,
+            Action.WORK_IN_PROGRESS: self.action_work_in_progress,
+            Action.DISPLAY_RESULTS: self.action_results,
+        }
+        self._request_dispatch: Final[dict[type, Callable[[], None]]] = {
+            McqIntegrityRequest: self.action_integrity_request,
+            McqNameRequest: self.action_name_request,
+            McqAnswersRequest: self.action_answers_request,
+        }
 
     @update_ui
     def finalize(self, path: Path = None) -> bool:
@@ -91,44 +185,43 @@ class FileEventsHandler(QObject):
 
     @property
     def current_file_shortname(self) -> str:
-        return (
-            self.state.current_file.name[: -len(CONFIG_FILE_EXTENSION)]
-            if self.state.current_file is not None
-            else ""
-        )
+        return self.state.current_file_shortname
 
+    @throttle(50)
     def _update_ui(self) -> None:
         """Update window and tab titles according to state data.
 
-        Assure synchronization between ui and state."""
+        Assure synchronization between ui and state.
 
+        Throttled: bursts of state changes (file-system events, scan process
+        requests) result in at most one refresh per interval."""
+
+        main_window = self.main_window
+        name: str | None = None
         if self.state.current_file is None:
-            self.main_window.setWindowTitle(param.WINDOW_TITLE)
-            self.main_window.header_label.setText("No document")
+            title = param.WINDOW_TITLE
         else:
             name = self.current_file_shortname
-            self.main_window.setWindowTitle(f"{param.WINDOW_TITLE} - {name}")
-            self.main_window.header_label.setText(
-                f"<p style='text-align:center'>Document <i><b>{name}</b></i> selected.</p>"
-                "<p style='text-align:center;font-size:small'>Press <b>F5</b> to start scanning.</p>"
+            title = f"{param.WINDOW_TITLE} - {name}"
+            main_window.set_navigation_enabled(True)
+        # Skip no-op setters: Qt emits change signals and schedules repaints
+        # unconditionally when a setter is called, even with an unchanged value.
+        if main_window.windowTitle() != title:
+            main_window.setWindowTitle(title)
+        if name != self._last_header_name:
+            self._last_header_name = name
+            main_window.header_label.setText(
+                "No document" if name is None else self._header_template.format(name=name)
             )
-            self.main_window.enable_navigation()
-
-        match self.state.current_action, self.state.current_request:
-            case Action.NONE, _:
-                self.action_none()
-            case Action.WORK_IN_PROGRESS, _:
-                self.action_work_in_progress()
-            case Action.PENDING_REQUEST, McqIntegrityRequest():
-                self.action_integrity_request()
-            case Action.PENDING_REQUEST, McqNameRequest():
-                self.action_name_request()
-            case Action.PENDING_REQUEST, McqAnswersRequest():
-                self.action_answers_request()
-            case Action.DISPLAY_RESULTS, _:
-                self.action_results()
-            case _:
-                raise NotImplementedError
+
+        action = self.state.current_action
+        if action == Action.PENDING_REQUEST:
+            handler = self._request_dispatch.get(type(self.state.current_request))
+        else:
+            handler = self._action_dispatch.get(action)
+        if handler is None:
+            raise NotImplementedError(f"{action}, {self.state.current_request!r}")
+        handler()
 
         self.update_status_message()
 
@@ -137,13 +230,15 @@ class FileEventsHandler(QObject):
     # ===============================
 
     def action_none(self):
-        self.main_window.disable_navigation()
+        self.main_window.set_navigation_enabled(False)
 
     def action_work_in_progress(self):
         self.main_window.header_label.setText("Scan en cours...")
+        # The header no longer shows the document name: invalidate the guard.
+        self._last_header_name = ""
 
     def action_integrity_request(self):
-        print("Integrity request.")
+        logger.debug("Integrity request.")
 
     def action_name_request(self):
         pass
@@ -161,10 +256,10 @@ class FileEventsHandler(QObject):
     @update_ui
     def open_file(self, path: Path = None) -> bool:
         if path is None:
-            path = self.open_file_dialog()
-            print(f"Selected path: '{path}'.")
-            if path is None:
-                return False
+            # Ask the user for a file; the selected one will be opened when the
+            # dialog's `fileSelected` signal fires (see `open_file_dialog()`).
+            self.open_file_dialog()
+            return False
         return self.state.open_file(path)
 
     @update_ui
@@ -176,22 +271,29 @@ class FileEventsHandler(QObject):
     @update_ui
     def start_scan(self) -> bool:
         """Launch scan."""
-        print(f"Starting scan of '{self.state.current_file}'...")
+        logger.debug("Starting scan of '%s'...", self.state.current_file)
         return True
 
+    @pyqtSlot(list)
     @update_ui
-    def on_request(self, request: McqRequest) -> bool:
-        """Handle requests from the scan process."""
-        assert isinstance(request, McqRequest), f"Invalid request: {request!r}"
-        self.state.current_action = Action.PENDING_REQUEST
-        self.state.current_request = request
+    def on_requests(self, requests: list[McqRequest]) -> bool:
+        """Handle a batch of requests from the scan process.
+
+        The worker delivers bursts of requests as one list, so the whole batch
+        results in a single UI refresh."""
+        for request in requests:
+            assert isinstance(request, McqRequest), f"Invalid request: {request!r}"
+            self.state.current_action = Action.PENDING_REQUEST
+            self.state.current_request = request
         return True
 
+    @pyqtSlot()
     @update_ui
     def on_scan_started(self) -> bool:
         self.state.current_action = Action.WORK_IN_PROGRESS
         return True
 
+    @pyqtSlot()
     @update_ui
     def on_scan_ended(self) -> bool:
         self.state.current_action = Action.DISPLAY_RESULTS
@@ -201,17 +303,34 @@ class FileEventsHandler(QObject):
     #      Dialogs
     # =================
 
-    def open_file_dialog(self) -> Path | None:
-        # noinspection PyTypeChecker
-        filename, _ = QFileDialog.getOpenFileName(
-            self.main_window,
-            "Open pTyX MCQ configuration file",
-            str(self.state.current_file),
-            f"pTyX MCQ configuration file (*{CONFIG_FILE_EXTENSION})",
-        )
-        return Path(filename) if filename else None
+    def open_file_dialog(self) -> None:
+        """Ask the user for a configuration file, without blocking the event loop.
+
+        The modal `QFileDialog.getOpenFileName` call would freeze repaints and any
+        background scan progress, so the dialog is opened asynchronously instead:
+        the selected file is handled when the `fileSelected` signal fires."""
+        dialog = QFileDialog(self.main_window, "Open pTyX MCQ configuration file")
+        # Native dialogs may freeze the event loop for seconds on some platforms,
+        # so use Qt's own implementation instead.
+        dialog.setOption(QFileDialog.Option.DontUseNativeDialog)
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        dialog.setDirectory(str(self.state.default_dir))
+        dialog.setNameFilter(CONFIG_FILE_FILTER)
+        dialog.fileSelected.connect(self._on_file_selected)
+        dialog.open()
+        # Keep a reference, else the dialog would be garbage-collected at once.
+        self._open_file_dialog = dialog
+
+    @pyqtSlot(str)
+    def _on_file_selected(self, filename: str) -> None:
+        self._open_file_dialog = None
+        if filename:
+            self.open_file(Path(filename))
 
     def update_status_message(self) -> None:
         # TODO: implement status message.
-        self.main_window.statusbar.setStyleSheet("")
-        self.main_window.status_label.setText("")
+        main_window = self.main_window
+        if main_window.statusbar.styleSheet():
+            main_window.statusbar.setStyleSheet("")
+        if main_window.status_label.text():
+            main_window.status_label.setText("")
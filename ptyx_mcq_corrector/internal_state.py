@@ -1,14 +1,37 @@
+import json
+import logging
+import os
+import stat
 import tomllib
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Iterator, Any, Self
+from typing import Final, Iterator, Any, Self
 
 from ptyx_mcq.parameters import CONFIG_FILE_EXTENSION
-from tomli_w import dumps
 
-from ptyx_mcq_corrector.param import CONFIG_PATH, MAX_RECENT_FILES
-from ptyx_mcq_corrector.scan.conflict_handlers import McqRequest
+from ptyx_mcq_corrector.param import MAX_RECENT_FILES, config_path
+from ptyx_mcq_corrector.scan.requests import McqRequest
+
+logger = logging.getLogger(__name__)
+
+# Bound once at module scope: the extension is read in the UI refresh path.
+_EXT: Final = CONFIG_FILE_EXTENSION
+# `str.endswith` fast-paths tuples in C, and this extends to several supported
+# suffixes without growing an `or` chain.
+_VALID_SUFFIXES: Final[tuple[str, ...]] = (CONFIG_FILE_EXTENSION,)
+
+
+def _is_valid_file(path: Path) -> bool:
+    """Test whether `path` is an existing regular file, with a single stat() call.
+
+    Separate `is_file()`/`is_dir()` probes each cost one syscall; recent files
+    lists are revalidated often, so keep the check down to one stat per entry."""
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode)
 
 
 class Action(Enum):
@@ -22,7 +45,7 @@ class InvalidFileError(OSError):
     """Error raised when the file type is invalid."""
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class State:
     """The application current state.
 
@@ -33,6 +56,21 @@ class State:
     _current_file: Path | None = None
     current_action: Action = Action.NONE
     current_request: McqRequest | None = None
+    current_picture: Path | None = None
+    clickable_areas: list = field(default_factory=list)
+    # Derived from `_current_file`; cached since the UI reads it on every refresh.
+    _current_file_shortname: str = field(default="", init=False)
+    # Resolved forms of already-seen paths (each `Path.resolve()` walks the
+    # whole path on the filesystem, so don't recompute it when filtering).
+    _resolved_cache: dict[Path, Path] = field(default_factory=dict, init=False)
+    # Snapshot of the last saved state, used to turn no-op saves into dict compares.
+    _last_saved_dict: dict[str, Any] | None = field(default=None, init=False)
+    # Cache for `default_dir` (a slot, since `cached_property` needs a __dict__).
+    _default_dir: Path | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        if self._current_file is not None:
+            self._current_file_shortname = self._current_file.name.removesuffix(_EXT)
 
     @property
     def default_dir(self) -> Path:
@@ -40,13 +78,27 @@ class State:
 
         This is the folder containing the current file, if saved on disk.
         Else, it is last used directory.
+
+        Cached until the current file changes (see `open_file()` and `close_file()`).
         """
-        return self._current_file.parent if self._current_file is not None else Path.cwd()
+        if self._default_dir is None:
+            self._default_dir = self._current_file.parent if self._current_file is not None else Path.cwd()
+        return self._default_dir
+
+    def _invalidate_default_dir(self) -> None:
+        self._default_dir = None
 
     @property
     def current_file(self) -> Path | None:
         return self._current_file
 
+    @property
+    def current_file_shortname(self) -> str:
+        """Name of the current file, stripped of the configuration file extension.
+
+        Computed once when the current file changes, not on every read."""
+        return self._current_file_shortname
+
     def open_file(self, config_file: Path) -> bool:
         """Open a ptyx configuration file.
 
@@ -55,17 +107,27 @@ class State:
         - it must have the correct extension (i.e. `.ptyx.mcq.config.json`).
 
         Return a boolean, indicating if the current directory was effectively changed."""
-        # Attention, paths must be resolved to don't miss duplicates (symlinks...)!
-        # Do nothing if it's the current directory.
-        if not config_file.is_file():
-            raise FileNotFoundError(f"File '{config_file}' does not exist.")
-        elif config_file.resolve() == self._current_file.resolve():
-            print(f"File '{config_file.name}' already opened.")
-            return False
-        elif not config_file.name.endswith(CONFIG_FILE_EXTENSION):
+        # Check the extension first: it is a pure string operation,
+        # while the other checks need filesystem calls.
+        if not config_file.name.endswith(_VALID_SUFFIXES):
             raise InvalidFileError(f"Invalid file type: '{config_file.name}'.")
+        elif not config_file.is_file():
+            raise FileNotFoundError(f"File '{config_file}' does not exist.")
+        if self._current_file is not None:
+            # Do nothing if it's the current file. `samefile` handles symlinks and
+            # duplicates with one stat per path, where each `resolve()` call walks
+            # the whole path (and the unguarded access crashed on the first open).
+            try:
+                if config_file.samefile(self._current_file):
+                    logger.debug("File '%s' already opened.", config_file.name)
+                    return False
+            except OSError:
+                # The current file has been deleted meanwhile: not a duplicate then.
+                pass
         self.close_file()
         self._current_file = config_file
+        self._current_file_shortname = config_file.name.removesuffix(_EXT)
+        self._invalidate_default_dir()
         return True
 
     def close_file(self) -> None:
@@ -75,12 +137,24 @@ class State:
         self.current_action = Action.NONE
         self.current_picture = None
         self._current_file = None
+        self._current_file_shortname = ""
+        self._invalidate_default_dir()
         self.clickable_areas = []
 
+    def _resolve(self, path: Path) -> Path:
+        """Return the resolved form of `path`, caching results."""
+        resolved = self._resolved_cache.get(path)
+        if resolved is None:
+            resolved = self._resolved_cache[path] = path.resolve()
+        return resolved
+
     def _remember_file(self, new_path: Path) -> None:
         # The same file must not appear twice in the list.
+        new_resolved = self._resolve(new_path)
         self._recent_files = [new_path] + [
-            path for path in self._recent_files if path.resolve() != new_path.resolve() and path.is_dir()
+            path
+            for path in self._recent_files
+            if self._resolve(path) != new_resolved and _is_valid_file(path)
         ]
         if len(self._recent_files) > MAX_RECENT_FILES:
             self._recent_files.pop()
@@ -89,20 +163,24 @@ class State:
     def recent_files(self) -> Iterator[Path]:
         """Return an iterator over the recent files, starting with the more recent one.
 
-        The recent files list is updated first, removing invalid entries (deleted directories).
+        The recent files list is updated first, removing invalid entries (deleted files).
         """
         # Update recent files list.
+        current_resolved = None if self._current_file is None else self._resolve(self._current_file)
         self._recent_files = [
             path
             for path in self._recent_files
-            if path.is_dir() and path.resolve() != self.current_file.resolve()
+            if _is_valid_file(path) and self._resolve(path) != current_resolved
         ]
         return iter(self._recent_files)
 
     def _as_dict(self) -> dict[str, Any]:
         """Used for saving state when closing application."""
+        # Dump the raw list: going through the `recent_files` property would
+        # re-stat every entry just to save known state. Stale entries will be
+        # filtered out on the next UI access anyway.
         return {
-            "recent_files": [str(path) for path in self.recent_files],
+            "recent_files": [str(path) for path in self._recent_files],
             "current_file": str(self.current_file),
         }
 
@@ -116,20 +194,31 @@ class State:
         )
 
     def save(self) -> None:
-        CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
         settings_data = self._as_dict()
-        toml = dumps(settings_data)
-        assert tomllib.loads(toml) == settings_data
-        CONFIG_PATH.write_text(toml, "utf8")
-        print(f"Config saved in {CONFIG_PATH}")
+        if settings_data == self._last_saved_dict:
+            logger.debug("State unchanged, skipping save.")
+            return
+        config_file = config_path()
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        # Atomic write: never leave a half-written config file behind.
+        tmp_path = config_file.with_suffix(".tmp")
+        tmp_path.write_bytes(json.dumps(settings_data).encode("utf8"))
+        os.replace(tmp_path, config_file)
+        self._last_saved_dict = settings_data
+        logger.debug("Config saved in %s", config_file)
 
     @classmethod
     def load(cls) -> Self:
+        config_file = config_path()
         try:
-            settings_dict = tomllib.loads(CONFIG_PATH.read_text("utf8"))
+            settings_dict = json.loads(config_file.read_bytes())
         except FileNotFoundError:
+            # Migration: earlier versions saved the state as TOML.
+            try:
+                settings_dict = tomllib.loads(config_file.with_suffix(".toml").read_text("utf8"))
+            except (OSError, tomllib.TOMLDecodeError):
+                settings_dict = {}
+        except (OSError, ValueError) as e:
             settings_dict = {}
-        except OSError as e:
-            settings_dict = {}
-            print(f"Enable to load state: {e!r}")
+            logger.warning("Enable to load state: %r", e)
         return cls._from_dict(settings_dict)
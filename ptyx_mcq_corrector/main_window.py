@@ -1,21 +1,32 @@
 #!/usr/bin/python3
 from argparse import Namespace
 from base64 import urlsafe_b64encode
-from pathlib import Path
+from functools import cached_property, lru_cache
+from hashlib import blake2b
 from typing import Final
 
-from PyQt6.QtGui import QCloseEvent, QIcon
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QMainWindow, QLabel
 
 from ptyx_mcq_corrector.file_events_handler import FileEventsHandler
 from ptyx_mcq_corrector.generated_ui.main_ui import Ui_MainWindow
 from ptyx_mcq_corrector.internal_state import State
-from ptyx_mcq_corrector.param import ICON_PATH
+from ptyx_mcq_corrector.param import get_app_icon
 from ptyx_mcq_corrector.scan.scan_handler import ScannerManager
 
 
-def path_hash(path: Path | str) -> str:
-    return urlsafe_b64encode(hash(str(path)).to_bytes(8, signed=True)).decode("ascii").rstrip("=")
+@lru_cache(maxsize=256)
+def path_hash(path: str) -> str:
+    """Short filename-safe hash of a path, stable across runs.
+
+    The builtin `hash()` is randomized per process (PYTHONHASHSEED), so temp
+    file names built from it could not be found again after a restart;
+    blake2b with an 8-byte digest gives the same short name every time.
+    Memoized (callers must pass a `str`, since mixing `Path` and `str` keys
+    would needlessly split the cache)."""
+    digest = blake2b(path.encode("utf8"), digest_size=8).digest()
+    return urlsafe_b64encode(digest).decode("ascii").rstrip("=")
 
 
 class McqCorrectorMainWindow(QMainWindow, Ui_MainWindow):
@@ -28,7 +39,6 @@ class McqCorrectorMainWindow(QMainWindow, Ui_MainWindow):
         # to get at least the recent files list.
         self.state = State.load()
         self.file_events_handler = FileEventsHandler(self)
-        self.scan_handler = ScannerManager(self)
         self.setupUi(self)
 
         # self.tmp_dir = Path(mkdtemp(prefix="mcq-editor-"))
@@ -37,20 +47,28 @@ class McqCorrectorMainWindow(QMainWindow, Ui_MainWindow):
         # -----------------
         # Customize display
         # -----------------
-        if not ICON_PATH.is_file():
-            print(f"File not found: {ICON_PATH}")
-        else:
-            self.setWindowIcon(QIcon(str(ICON_PATH)))
+        self.setWindowIcon(get_app_icon())
 
         self.status_label = QLabel(self)
         self.statusbar.addWidget(self.status_label)
 
+        # Last applied navigation-buttons state (None: not applied yet).
+        self._navigation_enabled: bool | None = None
+
         # -------------------
         #   Connect signals
         # -------------------
         self.connect_menu_signals()
         self.file_events_handler.finalize(args.path)
 
+    @cached_property
+    def scan_handler(self) -> ScannerManager:
+        """Scanner manager, instantiated lazily on the first scan request.
+
+        Most sessions start without scanning right away, so don't pay the
+        manager construction at startup."""
+        return ScannerManager(self)
+
     def connect_menu_signals(self) -> None:
         # Don't change handler variable value (because of name binding process in lambdas).
         handler: Final[FileEventsHandler] = self.file_events_handler
@@ -100,25 +118,33 @@ class McqCorrectorMainWindow(QMainWindow, Ui_MainWindow):
     # noinspection PyMethodOverriding
     def closeEvent(self, event: QCloseEvent | None) -> None:
         assert event is not None
-        assert self is not None
         if self.request_to_close():
             event.accept()
         else:
             event.ignore()
 
-    def disable_navigation(self):
-        self.previous_button.hide()
-        self.next_button.hide()
+    def set_navigation_enabled(self, enabled: bool) -> None:
+        """Show or hide the navigation buttons.
 
-    def enable_navigation(self):
-        self.previous_button.show()
-        self.next_button.show()
+        Idempotent: calling it with the already-applied state is a no-op,
+        so UI refreshes don't trigger redundant show/hide work."""
+        if enabled == self._navigation_enabled:
+            return
+        self._navigation_enabled = enabled
+        self.previous_button.setVisible(enabled)
+        self.next_button.setVisible(enabled)
 
     def request_to_close(self) -> bool:
         """Save state and return a boolean indicating if closing is accepted.
 
-        For now, requests are always accepted."""
-        self.state.save()
+        For now, requests are always accepted.
+
+        Saving is delegated to the global thread pool, so the window closes
+        without waiting for the disk write; the pool waits for its tasks
+        before the application exits, so the save still completes."""
+        pool = QThreadPool.globalInstance()
+        assert pool is not None
+        pool.start(self.state.save)
         return True
 
     # noinspection PyDefaultArgument
@@ -133,16 +159,12 @@ class McqCorrectorMainWindow(QMainWindow, Ui_MainWindow):
                 # This is tricky.
                 # 1. Function provided must not use `recent_file` as unbound variable,
                 # since its value will change later in this loop.
-                # So, we use a default argument as a trick to copy current `recent_file` value
-                # (and not a reference) inside the function.
-                # 2. PyQt pass to given slot a boolean value (what is its meaning ??) if (and only if)
+                # So, we use a default argument to bind the current `recent_file` value
+                # inside the function (no need to wrap it in a throwaway list).
+                # 2. PyQt pass to given slot a boolean value (the `checked` state) if (and only if)
                 # it detects that the function have at least one argument.
                 # So, we have to provide a first dummy argument to the following lambda function.
-                action.triggered.connect(
-                    lambda _, paths=[recent_file]: self.file_events_handler.open_doc(
-                        side=None, paths=list(paths)
-                    )
-                )
+                action.triggered.connect(lambda _, path=recent_file: self.file_events_handler.open_file(path))
             self.menu_Recent_Files.menuAction().setVisible(True)
 
     def add_desktop_menu_entry(self) -> None:
@@ -1,11 +1,41 @@
+import functools
+import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import platformdirs
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QIcon
 
 
 RESSOURCES_PATH = Path(__file__).parent.parent / "ressources"
 ICON_PATH = RESSOURCES_PATH / "mcq-corrector.svg"
 WINDOW_TITLE = "MCQ Corrector"
 DEBUG = True
-CONFIG_PATH = Path(platformdirs.user_config_path("mcq-corrector") / "config.toml")
 MAX_RECENT_FILES = 12
+# Budget of the Qt pixmap cache (in kilobytes), used when displaying scanned pages.
+PIXMAP_CACHE_LIMIT_KB = 100 * 1024
+
+
+@functools.cache
+def config_path() -> Path:
+    """Path of the user configuration file, resolved on first use.
+
+    Resolving the user config directory (through platformdirs) costs an import
+    and a few filesystem lookups, only needed when the state is loaded or saved."""
+    import platformdirs
+
+    return Path(platformdirs.user_config_path("mcq-corrector") / "config.json")
+
+
+@functools.cache
+def get_app_icon() -> "QIcon":
+    """Application icon, loaded once on first use.
+
+    Building a QIcon parses the SVG file, so the result is cached and shared
+    between the application and the main window instead of being built twice."""
+    from PyQt6.QtGui import QIcon
+
+    if not ICON_PATH.is_file():
+        logging.getLogger(__name__).warning("File not found: %s", ICON_PATH)
+        return QIcon()
+    return QIcon(str(ICON_PATH))
@@ -1,7 +1,4 @@
-from dataclasses import dataclass
-from enum import Enum
 from multiprocessing.connection import Connection
-from pathlib import Path
 from typing import Literal
 
 from ptyx.shell import print_error
@@ -16,56 +13,18 @@ from ptyx_mcq.scan.data_gestion.conflict_handling.data_check.fix import (
 )
 from ptyx_mcq.scan.data_gestion.conflict_handling.integrity_check.fix import AbstractIntegrityIssuesFixer
 from ptyx_mcq.scan.data_gestion.data_handler import DataHandler
-from ptyx_mcq.scan.data_gestion.document_data import Page, PicData
+from ptyx_mcq.scan.data_gestion.document_data import Page
 from ptyx_mcq.tools.config_parser import DocumentId, StudentName
 from ptyx_mcq.tools.misc import copy_docstring
 
-
-# Send this custom object to indicate that the connection must be closed.
-# (This is more explicit than None.)
-class EndConnectionRequest:
-    def __str__(self):
-        return "<END_CONNECTION_REQUEST>"
-
-    def __eq__(self, other):
-        return isinstance(other, EndConnectionRequest)
-
-
-END_CONNECTION_REQUEST = EndConnectionRequest()
-
-
-class McqRequest:
-    """Base class for all requests."""
-
-
-@dataclass
-class McqIntegrityRequest(McqRequest):
-    """McqRequest to be sent to main process, asking for which document version to keep."""
-
-    pic_path1: Path
-    pic_path2: Path
-
-
-@dataclass
-class McqNameRequest(McqRequest):
-    """McqRequest to be sent to main process, asking for the student name."""
-
-    pic_path: Path
-    suggestion: str
-
-
-@dataclass
-class McqAnswersRequest(McqRequest):
-    """McqRequest to be sent to main process, asking for answers review."""
-
-    pic_data: PicData
-
-
-class IntegrityAnswer(Enum):
-    KEEP_FIRST = 1
-    KEEP_SECOND = 2
-    NEXT = 3
-    PREVIOUS = 4
+from ptyx_mcq_corrector.scan.requests import (
+    END_CONNECTION_REQUEST,
+    IntegrityAnswer,
+    McqAnswersRequest,
+    McqIntegrityRequest,
+    McqNameRequest,
+    send_pickled,
+)
 
 
 class CustomAllDataIssuesFixer(DefaultAllDataIssuesFixer):
@@ -77,15 +36,25 @@ class CustomAllDataIssuesFixer(DefaultAllDataIssuesFixer):
     def run(self, check_result: DataCheckResult) -> None:
         super().run(check_result)
         connection: Connection = Config.extensions_data["connection"]
-        connection.send(END_CONNECTION_REQUEST)
+        send_pickled(connection, END_CONNECTION_REQUEST)
 
 
 class CustomDocHeaderDisplayer(AbstractDocHeaderDisplayer):
     """A (void) implementation of AbstractDocHeaderDisplayer.
 
     It does nothing, since document display is already handled by the GUI.
+
+    Since it is stateless, a single shared instance is enough, even though
+    the scan engine instantiates one displayer per reviewed document.
     """
 
+    _instance = None
+
+    def __new__(cls, data_storage: DataHandler, doc_id: DocumentId):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self, data_storage: DataHandler, doc_id: DocumentId):
         pass
 
@@ -96,6 +65,13 @@ class CustomDocHeaderDisplayer(AbstractDocHeaderDisplayer):
         pass
 
 
+# Map GUI answers to the version number expected by `select_version()`.
+_ANSWER_MAP: dict[IntegrityAnswer, Literal[1, 2]] = {
+    IntegrityAnswer.KEEP_FIRST: 1,
+    IntegrityAnswer.KEEP_SECOND: 2,
+}
+
+
 class CustomIntegrityIssuesFixer(AbstractIntegrityIssuesFixer):
     """Custom implementation of AbstractIntegrityIssuesFixer."""
 
@@ -103,20 +79,19 @@ class CustomIntegrityIssuesFixer(AbstractIntegrityIssuesFixer):
         self, scanned_doc_id: DocumentId, temp_doc_id: DocumentId, page: Page
     ) -> Literal[1, 2]:
         connection: Connection = Config.extensions_data["connection"]
-        connection.send(
+        send_pickled(
+            connection,
             McqIntegrityRequest(
                 pic_path1=self.data_storage.absolute_pic_path_for_page(scanned_doc_id, page),
                 pic_path2=self.data_storage.absolute_pic_path_for_page(temp_doc_id, page),
-            )
+            ),
         )
-        match (answer := connection.recv()):
-            case IntegrityAnswer.KEEP_FIRST:
-                return 1
-            case IntegrityAnswer.KEEP_SECOND:
-                return 2
-            case _:
-                print_error(f"I can't handle the following answer: {answer!r}")
-                raise NotImplementedError
+        answer = connection.recv()
+        try:
+            return _ANSWER_MAP[answer]
+        except (KeyError, TypeError):
+            print_error(f"I can't handle the following answer: {answer!r}")
+            raise NotImplementedError
 
 
 class CustomNamesReviewer(AbstractNamesReviewer):
@@ -130,11 +105,12 @@ class CustomNamesReviewer(AbstractNamesReviewer):
     @copy_docstring(AbstractNamesReviewer._ask_user_for_name)
     def _ask_user_for_name(self, suggestion: str, doc_id: DocumentId) -> str:
         connection: Connection = Config.extensions_data["connection"]
-        connection.send(
+        send_pickled(
+            connection,
             McqNameRequest(
                 pic_path=self.data_storage.absolute_pic_path_for_page(doc_id=doc_id, page=Page(1)),
                 suggestion=suggestion,
-            )
+            ),
         )
         answer = connection.recv()
         if not isinstance(answer, str):
@@ -148,11 +124,14 @@ class CustomAnswersReviewer(AbstractAnswersReviewer):
 
     def edit_answers(self, doc_id: DocumentId, page: Page) -> tuple[Action, bool]:
         connection: Connection = Config.extensions_data["connection"]
-        connection.send(McqAnswersRequest(pic_data=self.data[doc_id].pages[page]))
+        send_pickled(connection, McqAnswersRequest(pic_data=self.data[doc_id].pages[page]))
         answer = connection.recv()
-        match answer:
-            case Action(), bool():
-                return answer
-            case _:
-                print_error(f"I can't handle the following answer: {answer!r}")
-                raise NotImplementedError
+        if (
+            isinstance(answer, tuple)
+            and len(answer) == 2
+            and isinstance(answer[0], Action)
+            and isinstance(answer[1], bool)
+        ):
+            return answer
+        print_error(f"I can't handle the following answer: {answer!r}")
+        raise NotImplementedError
@@ -0,0 +1,93 @@
+"""
+Message types exchanged between the GUI, the scan worker thread and the scan process.
+
+This module must remain cheap to import: it is pulled in by the GUI at startup
+(for signals signatures and state handling), while the heavy ptyx_mcq scan
+machinery is only imported when a scan actually starts.
+"""
+
+import pickle
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing import Process
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ptyx_mcq.scan.data_gestion.document_data import PicData
+
+
+# Send this custom object to indicate that the connection must be closed.
+# (This is more explicit than None.)
+class EndConnectionRequest:
+    """Sentinel type: its unique instance is `END_CONNECTION_REQUEST`.
+
+    Unpickling returns that very instance (see `__reduce__`), so even after
+    crossing the process boundary the sentinel can be recognized with a plain
+    identity test, with no custom `__eq__` involved."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "<END_CONNECTION_REQUEST>"
+
+    def __reduce__(self):
+        return (_end_connection_request, ())
+
+
+def _end_connection_request() -> "EndConnectionRequest":
+    return END_CONNECTION_REQUEST
+
+
+END_CONNECTION_REQUEST = EndConnectionRequest()
+
+
+def send_pickled(connection: Connection, obj: object) -> None:
+    """Send `obj` through `connection`, pickled with the most recent protocol.
+
+    `Connection.send` still pickles with the old default protocol; the latest
+    one serializes binary payloads (like the picture data embedded in requests)
+    faster and more compactly. The wire format is otherwise the same, so the
+    other side keeps reading objects with a plain `recv()`."""
+    connection.send_bytes(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class McqRequest:
+    """Base class for all requests."""
+
+
+@dataclass
+class McqIntegrityRequest(McqRequest):
+    """McqRequest to be sent to main process, asking for which document version to keep."""
+
+    pic_path1: Path
+    pic_path2: Path
+
+
+@dataclass
+class McqNameRequest(McqRequest):
+    """McqRequest to be sent to main process, asking for the student name."""
+
+    pic_path: Path
+    suggestion: str
+
+
+@dataclass
+class McqAnswersRequest(McqRequest):
+    """McqRequest to be sent to main process, asking for answers review."""
+
+    pic_data: "PicData"
+
+
+class IntegrityAnswer(Enum):
+    KEEP_FIRST = 1
+    KEEP_SECOND = 2
+    NEXT = 3
+    PREVIOUS = 4
+
+
+@dataclass
+class ProcessInfo:
+    process: Process
+    pipe_this_side: Connection
@@ -17,38 +17,43 @@ Architecture:
   forever waiting for the next message).
 """
 
+import logging
 from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QThread, pyqtSignal, QObject
+from PyQt6.QtCore import QThread, Qt, pyqtSignal, pyqtSlot, QObject
 
-from ptyx_mcq_corrector.internal_state import Action
-from ptyx_mcq_corrector.scan.scan_worker import ProcessInfo, ScanWorker
+from ptyx_mcq_corrector.scan.requests import ProcessInfo
 
 if TYPE_CHECKING:
     from ptyx_mcq_corrector.main_window import McqCorrectorMainWindow
-from ptyx_mcq_corrector.scan.conflict_handlers import (
-    McqAnswersRequest,
-    McqNameRequest,
-    McqIntegrityRequest,
-    McqRequest,
-)
+    from ptyx_mcq_corrector.scan.scan_worker import ScanWorker
+
+logger = logging.getLogger(__name__)
 
 
 class ScannerManager(QObject):
     """Scanner manager, which communicates with the ScanWorker in the other thread."""
 
     # The GUI will connect to those signals to update the interface.
-    scan_started = pyqtSignal(name="scan_started")
-    scan_ended = pyqtSignal(name="scan_ended")
+    scan_started = pyqtSignal()
+    scan_ended = pyqtSignal()
 
     def __init__(self, main_window: "McqCorrectorMainWindow"):
         super().__init__(None)
         self.main_window = main_window
         self.current_process_info: ProcessInfo | None = None
         self.current_thread: QThread | None = None
-        self.worker: ScanWorker | None = None
-        self.scan_started.connect(self.main_window.file_events_handler.on_scan_started)
-        self.scan_ended.connect(self.main_window.file_events_handler.on_scan_ended)
+        self.worker: "ScanWorker | None" = None
+        # Both endpoints live in the GUI thread: make the connection type explicit,
+        # to skip the AutoConnection thread-affinity check on every emit.
+        # (The PyQt6 stubs don't declare the connection-type parameter, although
+        # it exists at runtime, hence the ignores.)
+        self.scan_started.connect(  # type: ignore[call-arg]
+            self.main_window.file_events_handler.on_scan_started, Qt.ConnectionType.DirectConnection
+        )
+        self.scan_ended.connect(  # type: ignore[call-arg]
+            self.main_window.file_events_handler.on_scan_ended, Qt.ConnectionType.DirectConnection
+        )
 
     @property
     def compilation_is_running(self) -> bool:
@@ -60,33 +65,50 @@ class ScannerManager(QObject):
         In this new thread, a ScanWorker instance will handle the scan
         and launch a new process.
         """
+        # Deferred import: scan_worker pulls in the ptyx_mcq machinery, which
+        # is only needed once a scan is actually launched.
+        from ptyx_mcq_corrector.scan.scan_worker import ScanWorker
+
         current_file = self.main_window.state.current_file
         if current_file is not None:
             self.current_thread = thread = QThread(self.main_window)
             self.worker = worker = ScanWorker(current_file)
             worker.moveToThread(self.current_thread)
-            worker.process_started.connect(self.on_scan_started)
-            worker.finished.connect(self.on_scan_ended)
+            # The worker emits from its own thread while the receivers live in
+            # the GUI thread: state the queued delivery explicitly, instead of
+            # having AutoConnection re-resolve the thread affinity on each emit.
+            queued = Qt.ConnectionType.QueuedConnection
+            worker.process_started.connect(self.on_scan_started, queued)
+            worker.finished.connect(self.on_scan_ended, queued)
             worker.finished.connect(worker.deleteLater)
-            worker.request.connect(self.main_window.file_events_handler.on_request)
+            worker.requests.connect(self.main_window.file_events_handler.on_requests, queued)
             # noinspection PyUnresolvedReferences
             thread.started.connect(worker.generate)
-            thread.started.connect(lambda: print("Scan thread started..."))
-            thread.finished.connect(lambda: print("Scan thread ended."))
+            thread.started.connect(self._on_thread_started)
+            thread.finished.connect(self._on_thread_finished)
             thread.finished.connect(thread.deleteLater)
             thread.start()
-            assert self.current_thread is not None
 
+    @pyqtSlot()
+    def _on_thread_started(self):
+        logger.debug("Scan thread started...")
+
+    @pyqtSlot()
+    def _on_thread_finished(self):
+        logger.debug("Scan thread ended.")
+
+    @pyqtSlot(ProcessInfo)
     def on_scan_started(self, process: ProcessInfo):
         """Actions executing once the scan process starts."""
-        print("ScannerManager.on_scan_started()")
+        logger.debug("ScannerManager.on_scan_started()")
         assert self.current_process_info is None
         self.current_process_info = process
         self.scan_started.emit()
 
+    @pyqtSlot()
     def on_scan_ended(self):
         """Actions executing once the scan process ends."""
-        print("ScannerManager.on_scan_ended()")
+        logger.debug("ScannerManager.on_scan_ended()")
         self.worker = None
         self.current_thread.quit()
         self.current_thread.wait()
@@ -100,9 +122,8 @@ class ScannerManager(QObject):
             process = self.current_process_info.process
             id_ = process.pid
             process.kill()
-            pipe_other_side = self.current_process_info.pipe_other_side
-            assert pipe_other_side is not None
             process.join()
-            pipe_other_side.send(None)
-            print(f"Process {id_} interrupted.")
-            self.on_scan_ended()
+            logger.debug("Process %s interrupted.", id_)
+            # Killing the process makes the worker's pipe report EOF: its main
+            # loop ends and its `finished` signal drives the teardown, so
+            # `on_scan_ended()` must not be called again here.
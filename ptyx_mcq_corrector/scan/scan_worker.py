@@ -1,34 +1,47 @@
 import contextlib
+import functools
+import io
 import multiprocessing
 import pickle
-from dataclasses import dataclass
 from multiprocessing import Process
 from multiprocessing.connection import Connection
 from pathlib import Path
 from traceback import print_exception
 from typing import TypedDict, NotRequired
 
-from PyQt6.QtCore import QObject, pyqtSignal
-from ptyx.shell import print_success, red, yellow
-from ptyx_mcq.cli import scan
-from ptyx_mcq.scan.data_gestion.conflict_handling.config import Config
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from ptyx_mcq.tools.misc import CaptureLog
 
-from ptyx_mcq_corrector.scan.conflict_handlers import (
+import ptyx_mcq_corrector.param as param
+from ptyx_mcq_corrector.scan.requests import (
     McqRequest,
     END_CONNECTION_REQUEST,
-    CustomNamesReviewer,
-    CustomAnswersReviewer,
-    CustomIntegrityIssuesFixer,
-    CustomDocHeaderDisplayer,
+    ProcessInfo,
+    send_pickled,
 )
 
 
-@dataclass
-class ProcessInfo:
-    process: Process
-    pipe_this_side: Connection
-    pipe_other_side: Connection
+@functools.cache
+def _scan_context():
+    """Multiprocessing context used to launch scan processes.
+
+    On POSIX, a forkserver keeps a warmed-up server process around with the
+    heavy ptyx_mcq modules preloaded, so each scan after the first one skips
+    the full interpreter startup and import chain that "spawn" pays.
+    "spawn" remains the fallback on platforms without forkserver support.
+    """
+    # https://docs.python.org/3/library/multiprocessing.html#multiprocessing-start-methods
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(
+            [
+                "ptyx_mcq.cli",
+                "ptyx_mcq.scan.data_gestion.conflict_handling.config",
+                "ptyx_mcq_corrector.scan.conflict_handlers",
+            ]
+        )
+        return ctx
+    return multiprocessing.get_context("spawn")
 
 
 class ScanWorkerInfo(TypedDict):
@@ -43,25 +56,25 @@ class ScanWorker(QObject):
 
     It communicates with main thread through a `ScannerManager` instance."""
 
-    finished = pyqtSignal(dict, name="finished")
-    process_started = pyqtSignal(ProcessInfo, name="process_started")
-    request = pyqtSignal(McqRequest, name="request")
+    # Let PyQt derive the (normalized) signal names from the attribute names.
+    finished = pyqtSignal(dict)
+    process_started = pyqtSignal(ProcessInfo)
+    requests = pyqtSignal(list)
 
     def __init__(self, path: Path):
         super().__init__(None)
         self.path = path
-        assert self.path is not None
 
+    @pyqtSlot()
     def generate(self) -> None:
-        print("ScanWorker.generate()")
         return_data: ScanWorkerInfo = {"path": self.path, "log": ""}
-        # log: CaptureLog | str = "Error, log couldn't be captured!"
-        with CaptureLog() as log:
+        # Capturing the log intercepts every write to stdout; only pay for it
+        # in debug runs (the scan output itself comes from the child process).
+        with CaptureLog() if param.DEBUG else contextlib.nullcontext(io.StringIO()) as log:
             try:
                 return_data = self._generate()
             finally:
                 return_data["log"] = log.getvalue()
-                print("End of task: emit 'finished' event.")
                 self.finished.emit(return_data)
 
     def _generate(self) -> ScanWorkerInfo:
@@ -78,49 +91,81 @@ class ScanWorker(QObject):
         #     return
         # code = editor.text() if doc_path is None else doc_path.read_text(encoding="utf8")
 
-        # Change current directory to the parent directory of the ptyx file.
-        # This allows for relative paths in include directives when compiling.
-        with contextlib.chdir(self.path.parent):
-            # https://docs.python.org/3/library/multiprocessing.html#multiprocessing-start-methods
-            ctx = multiprocessing.get_context("spawn")
-            this_side: Connection
-            other_side: Connection
-            this_side, other_side = ctx.Pipe(duplex=True)
-            process: Process = ctx.Process(  # type: ignore
-                target=scan_path,
-                args=(
-                    self.path,
-                    other_side,
-                ),
-            )
-            # Share process with main thread, to enable user to kill it if needed.
-            # This may prove useful if there is an infinite loop in user code
-            # for example.
-            self.process_started.emit(ProcessInfo(process, this_side, other_side))
-            process.start()
-            print(f"Waiting for process {process.pid}")
-
-            return_data = self._main_loop(this_side, other_side)
-            print(f"End of process {process.pid}")
-        print("Process data successfully recovered.")
-
-        return return_data
-
-    def _main_loop(self, this_side: Connection, other_side: Connection) -> ScanWorkerInfo:
+        # The scan process changes its own working directory (see `scan_path()`);
+        # with a forkserver, children inherit the server's directory, not ours,
+        # so changing it here would only affect the very first scan.
+        ctx = _scan_context()
+        this_side: Connection
+        other_side: Connection
+        this_side, other_side = ctx.Pipe(duplex=True)
+        process: Process = ctx.Process(
+            target=scan_path,
+            args=(
+                self.path,
+                other_side,
+            ),
+        )
+        # Share process with main thread, to enable user to kill it if needed.
+        # This may prove useful if there is an infinite loop in user code
+        # for example.
+        self.process_started.emit(ProcessInfo(process, this_side))
+        process.start()
+        # The child got its own copy of `other_side` when it was spawned;
+        # close ours, so that the pipe reports EOF once the child exits
+        # (instead of recv() hanging forever on our own write end).
+        other_side.close()
+        return self._main_loop(this_side)
+
+    def _main_loop(self, this_side: Connection) -> ScanWorkerInfo:
+        """Read messages from the scan process until it closes the connection.
+
+        Messages are drained in batches: after blocking on the first one, any
+        already-pending messages are read too, and the collected requests are
+        emitted as a single signal, so a burst of messages triggers one
+        cross-thread delivery (and one UI refresh) instead of one per message."""
         return_data: ScanWorkerInfo = {"path": self.path, "log": "No log."}
-        while (content := this_side.recv()) != END_CONNECTION_REQUEST:
-            if isinstance(content, McqRequest):
-                self.request.emit(content)
-            elif isinstance(content, BaseException):
-                # TODO: store all errors, not only last one.
-                return_data["error"] = content
-            else:
-                raise ValueError(f"Unrecognized data: {content}")
+        done = False
+        while not done:
+            batch: list[McqRequest] = []
+            try:
+                content = this_side.recv()
+                while True:
+                    if content is END_CONNECTION_REQUEST:
+                        done = True
+                    elif isinstance(content, McqRequest):
+                        batch.append(content)
+                    elif isinstance(content, BaseException):
+                        # TODO: store all errors, not only last one.
+                        return_data["error"] = content
+                    else:
+                        raise ValueError(f"Unrecognized data: {content}")
+                    if done or not this_side.poll(0):
+                        break
+                    content = this_side.recv()
+            except EOFError:
+                # The scan process ended without sending the sentinel
+                # (e.g. it was killed through `abort_scan()`).
+                done = True
+            if batch:
+                self.requests.emit(batch)
         return return_data
 
 
 def scan_path(path: Path, connection: Connection) -> None:
     """Scan documents from another process, using a Connection to communicate."""
+    # This function runs in the scan process only: import the ptyx_mcq scan
+    # machinery here, so the GUI process never pays for it (the forkserver
+    # preloads these modules, see `_scan_context()`).
+    from ptyx.shell import print_success, red, yellow
+    from ptyx_mcq.cli import scan
+    from ptyx_mcq.scan.data_gestion.conflict_handling.config import Config
+
+    from ptyx_mcq_corrector.scan.conflict_handlers import (
+        CustomNamesReviewer,
+        CustomAnswersReviewer,
+        CustomIntegrityIssuesFixer,
+        CustomDocHeaderDisplayer,
+    )
 
     # Customize conflicts' handling process.
     Config.NamesReviewer = CustomNamesReviewer
@@ -130,34 +175,30 @@ def scan_path(path: Path, connection: Connection) -> None:
     Config.extensions_data["connection"] = connection
 
     try:
-        scan(path)
+        # Change current directory to the parent directory of the ptyx file.
+        # This allows for relative paths in include directives when compiling.
+        with contextlib.chdir(path.parent):
+            scan(path)
         print_success(f"Scan completed: '{path}'.")
     except BaseException as e:
         # An error occurred, we will share it with the main process if we can.
-        # For that, we have to test that the error is serializable, before sharing it through the pipe.
         # (To communicate between processes, objects are serialized and deserialized
-        # using pickle, so only serializable objects can be shared).
-        pickle_incompatibility = False
+        # using pickle, so only serializable objects can be shared.)
+        # Pickle the exception once ourselves: on success the payload is sent as is
+        # (`Connection.send` is just `send_bytes(pickle.dumps(obj))`, so the other
+        # side reads it with a plain `recv()`); on failure, we fall back to a
+        # vanilla `RuntimeError`, without pickling the incompatible exception twice.
         try:
-            if type(pickle.loads(pickle.dumps(e))) != type(e):
-                pickle_incompatibility = True
-        except BaseException:
-            pickle_incompatibility = True
-            raise
-        finally:
-            if pickle_incompatibility:
-                print(red(f"ERROR: Exception {type(e)} is not compatible with pickle!"))
-                print(yellow("Please open a bug report about it!"))
-                # Do not try to serialize this incompatible exception,
-                # this will fail, and may even generate segfaults!
-                # Let's use a vanilla `RuntimeError` instead.
-                # (Yet, we should make this exception compatible with pickle asap...)
-                connection.send(RuntimeError(str(e)))
-            else:
-                connection.send(e)
-        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxx")
-        print(e, type(e), repr(e))
+            payload = pickle.dumps(e, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            print(red(f"ERROR: Exception {type(e)} is not compatible with pickle!"))
+            print(yellow("Please open a bug report about it!"))
+            # Do not try to serialize this incompatible exception,
+            # this will fail, and may even generate segfaults!
+            # (Yet, we should make this exception compatible with pickle asap...)
+            send_pickled(connection, RuntimeError(str(e)))
+        else:
+            connection.send_bytes(payload)
         print_exception(e)
-        print("xxxxxxxxxxxxxxxxxxxxxxxxxxxx")
     # End communication.
-    connection.send(END_CONNECTION_REQUEST)
+    send_pickled(connection, END_CONNECTION_REQUEST)